@@ -11,11 +11,44 @@ The app supports:
 
 import os
 
+# Make socket I/O (requests to OMDb) cooperative when running under gevent.
+# sqlite3 is a C module that gevent does not patch, so database calls still
+# block the worker while they run. This must happen before any other module
+# imports socket or threading.
+if os.environ.get("GEVENT_PATCH") == "1":
+    from gevent import monkey
+
+    monkey.patch_all()
+
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import httpx
 import requests
-from flask import Flask, redirect, render_template, request, url_for
+from flask import (
+    Flask,
+    Response,
+    redirect,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
+from flask_caching import Cache
+from flask_compress import Compress
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+from requests.adapters import HTTPAdapter
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 from data_manager import DataManager
-from models import Movie, User, db
+from models import Movie, db
 
 app = Flask(__name__)
 
@@ -23,55 +56,549 @@ app = Flask(__name__)
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(BASE_DIR, 'data/movies.db')}"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "future": True,
+    "pool_pre_ping": True,
+    "connect_args": {"check_same_thread": False},
+}
+
+# SQLite tuning applied to every new connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Enable WAL mode and tune caching on new SQLite connections.
+
+    Args:
+        dbapi_connection: Raw DB-API connection.
+        connection_record: Pool record for the connection (unused).
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 # Init SQLAlchemy
 db.init_app(app)
 
-# Create tables (only if they don't exist)
+# Create tables and indexes (only if they don't exist)
 with app.app_context():
     db.create_all()
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+# Rendered-page cache. It lives on disk so every Gunicorn worker shares the
+# same entries; page keys include DataManager.data_version, so a committed
+# write makes every worker render fresh pages.
+app.config["CACHE_TYPE"] = "FileSystemCache"
+app.config["CACHE_DIR"] = os.path.join(BASE_DIR, ".page_cache")
+app.config["CACHE_DEFAULT_TIMEOUT"] = 60
+cache = Cache(app)
+
+# Data access layer; the version tokens are kept in the shared cache
+dm = DataManager(cache)
+
+# Compress text responses; let browsers cache static assets for a year
+app.config["COMPRESS_MIMETYPES"] = ["text/html", "text/css", "application/json"]
+app.config["COMPRESS_LEVEL"] = 5
+app.config["COMPRESS_BR_LEVEL"] = 4
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
+Compress(app)
+
+# Keep compiled templates on disk so new workers skip Jinja parsing
+JINJA_CACHE_DIR = os.path.join(BASE_DIR, ".jinja_cache")
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
+# Shared HTTP session so OMDb lookups reuse keep-alive connections
+OMDB_URL = "https://www.omdbapi.com/"
+_omdb_session = requests.Session()
+_omdb_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+_omdb_session.headers["User-Agent"] = "MoviWebApp/1.0"
+
+
+def get_session() -> requests.Session:
+    """
+    Return the HTTP session used for OMDb requests.
 
-# Data access layer
-dm = DataManager()
+    Returns:
+        The module-level requests.Session.
+    """
+    return _omdb_session
+
+
+# Fields of an OMDb response that the app actually uses
+OMDB_FIELDS = ("Title", "Director", "Year", "Poster")
+
+# Titles OMDb found: normalized title -> used OMDb fields (LRU order)
+OMDB_HIT_MAX = 2048
+_omdb_hits: OrderedDict[str, dict] = OrderedDict()
+
+# Titles OMDb did not find: normalized title -> monotonic expiry time
+OMDB_MISS_TTL = 300.0
+OMDB_MISS_MAX = 4096
+_omdb_miss: OrderedDict[str, float] = OrderedDict()
+
+# Guards both lookup caches
+_omdb_cache_lock = threading.Lock()
+
+
+def _cached_hit(title_norm: str) -> dict | None:
+    """
+    Return the cached OMDb data for a title OMDb found before.
+
+    Args:
+        title_norm: Stripped, case-folded movie title.
+
+    Returns:
+        A copy of the cached OMDb fields, or None if not cached.
+    """
+    with _omdb_cache_lock:
+        data = _omdb_hits.get(title_norm)
+        if data is None:
+            return None
+        _omdb_hits.move_to_end(title_norm)
+        return dict(data)
+
+
+def _record_hit(title_norm: str, data: dict) -> None:
+    """
+    Cache OMDb data for a found title, evicting the least recently used.
+
+    Args:
+        title_norm: Stripped, case-folded movie title.
+        data: Used OMDb fields for the title.
+    """
+    with _omdb_cache_lock:
+        _omdb_hits[title_norm] = dict(data)
+        _omdb_hits.move_to_end(title_norm)
+        while len(_omdb_hits) > OMDB_HIT_MAX:
+            _omdb_hits.popitem(last=False)
+
+
+def _is_recent_miss(title_norm: str) -> bool:
+    """
+    Check whether OMDb recently reported a title as not found.
+
+    Args:
+        title_norm: Stripped, case-folded movie title.
+
+    Returns:
+        True if an unexpired miss is recorded for the title.
+    """
+    with _omdb_cache_lock:
+        expires_at = _omdb_miss.get(title_norm)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            del _omdb_miss[title_norm]
+            return False
+        _omdb_miss.move_to_end(title_norm)
+        return True
+
+
+def _record_miss(title_norm: str) -> None:
+    """
+    Remember that OMDb did not find a title, evicting the oldest entries.
+
+    Args:
+        title_norm: Stripped, case-folded movie title.
+    """
+    with _omdb_cache_lock:
+        _omdb_miss[title_norm] = time.monotonic() + OMDB_MISS_TTL
+        _omdb_miss.move_to_end(title_norm)
+        while len(_omdb_miss) > OMDB_MISS_MAX:
+            _omdb_miss.popitem(last=False)
+
+
+def _record_result(title_norm: str, data: dict | None) -> None:
+    """
+    Store an OMDb lookup result in the hit or miss cache.
+
+    Args:
+        title_norm: Stripped, case-folded movie title.
+        data: Used OMDb fields if found; otherwise None.
+    """
+    if data is None:
+        _record_miss(title_norm)
+    else:
+        _record_hit(title_norm, data)
+
+
+def _fetch_omdb_uncached(title_norm: str, api_key: str) -> dict | None:
+    """
+    Query OMDb for a normalized title, bypassing the lookup caches.
+
+    Args:
+        title_norm: Stripped, case-folded movie title.
+        api_key: OMDb API key.
+
+    Returns:
+        Dict with the used OMDb fields if found; otherwise None.
+    """
+    response = get_session().get(
+        OMDB_URL,
+        params={"apikey": api_key, "t": title_norm},
+        timeout=10,
+    )
+    return _parse_omdb_response(response.json())
+
+
+def _parse_omdb_response(data: dict) -> dict | None:
+    """
+    Reduce an OMDb JSON response to the fields the app uses.
+
+    Args:
+        data: Decoded OMDb response.
+
+    Returns:
+        Dict with the used OMDb fields if found; otherwise None.
+    """
+    if data.get("Response") != "True":
+        return None
+
+    return {key: data.get(key) for key in OMDB_FIELDS}
 
 
 def fetch_movie_from_omdb(title: str) -> dict | None:
     """
     Fetch a movie from OMDb.
 
+    Found titles are cached per normalized title (up to OMDB_HIT_MAX),
+    so repeated submissions do not hit the network again. Titles OMDb
+    did not find are remembered for OMDB_MISS_TTL seconds.
+
     Args:
         title: Movie title to search in OMDb.
 
     Returns:
-        OMDb JSON dict if found and API key is configured; otherwise None.
+        Dict with OMDb Title/Director/Year/Poster if found and API key
+        is configured; otherwise None.
     """
     api_key = os.environ.get("OMDB_API_KEY", "").strip()
     if not api_key:
         return None
 
-    response = requests.get(
-        "https://www.omdbapi.com/",
-        params={"apikey": api_key, "t": title},
+    title_norm = title.strip().casefold()
+    data = _cached_hit(title_norm)
+    if data is not None or _is_recent_miss(title_norm):
+        return data
+
+    data = _fetch_omdb_uncached(title_norm, api_key)
+    _record_result(title_norm, data)
+    return dict(data) if data else None
+
+
+# Upper bound on simultaneous OMDb requests during bulk imports
+OMDB_CONCURRENCY = 10
+
+# Titles accepted per bulk import; extra lines are ignored
+MAX_BULK_TITLES = 100
+
+
+# Workers shared by all bulk imports in this process (greenlets under gevent)
+_bulk_executor = ThreadPoolExecutor(
+    max_workers=OMDB_CONCURRENCY, thread_name_prefix="omdb-bulk"
+)
+
+
+def _fetch_many(titles: list[str]) -> list[dict | None]:
+    """
+    Look up many titles in OMDb concurrently.
+
+    Requests run on a bounded worker pool, so at most OMDB_CONCURRENCY
+    are in flight per process, and share one HTTP/2 connection pool.
+    Cached hits and recent misses are served without a request and new
+    results are cached, as in fetch_movie_from_omdb.
+
+    Args:
+        titles: Movie titles to search in OMDb.
+
+    Returns:
+        For each title, a dict with the used OMDb fields if found;
+        otherwise None (also on request errors or a missing API key).
+    """
+    api_key = os.environ.get("OMDB_API_KEY", "").strip()
+    if not api_key:
+        return [None] * len(titles)
+
+    with httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=20),
         timeout=10,
+        headers={"User-Agent": "MoviWebApp/1.0"},
+    ) as client:
+
+        def fetch(title: str) -> dict | None:
+            title_norm = title.strip().casefold()
+            data = _cached_hit(title_norm)
+            if data is not None or _is_recent_miss(title_norm):
+                return data
+
+            response = client.get(
+                OMDB_URL,
+                params={"apikey": api_key, "t": title_norm},
+            )
+            data = _parse_omdb_response(response.json())
+            _record_result(title_norm, data)
+            return data
+
+        futures = [_bulk_executor.submit(fetch, title) for title in titles]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception:
+                results.append(None)
+
+    return results
+
+
+# Leading four-digit year in OMDb "Year" values such as "1979" or "2008–2013"
+_YEAR_RE = re.compile(r"(\d{4})")
+
+
+def _parse_year(value: str | None) -> int | None:
+    """
+    Extract the leading year from an OMDb "Year" value.
+
+    Args:
+        value: Raw "Year" string from OMDb, or None.
+
+    Returns:
+        The year as int, or None if it does not start with four digits.
+    """
+    match = _YEAR_RE.match(value or "")
+    return int(match.group(1)) if match else None
+
+
+def _omdb_payload(data: dict, fallback_title: str) -> dict:
+    """
+    Map OMDb fields onto Movie column values.
+
+    Args:
+        data: OMDb movie data.
+        fallback_title: Title to use if OMDb has none.
+
+    Returns:
+        Dict with name, director, year and poster_url.
+    """
+    return {
+        "name": data.get("Title", fallback_title),
+        "director": data.get("Director"),
+        "year": _parse_year(data.get("Year")),
+        "poster_url": data.get("Poster"),
+    }
+
+
+def _enrich_from_omdb(title: str) -> dict | None:
+    """
+    Look up a title in OMDb and map the result onto Movie column values.
+
+    Args:
+        title: Movie title to search in OMDb.
+
+    Returns:
+        Dict with name, director, year and poster_url if found; otherwise None.
+    """
+    data = fetch_movie_from_omdb(title)
+    return _omdb_payload(data, title) if data else None
+
+
+# Background workers that enrich movies with OMDb data off the request path
+_omdb_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="omdb")
+
+
+def _enrich_movie(movie_id: int, title: str) -> None:
+    """
+    Look up a movie in OMDb and store director/year/poster on it.
+
+    Runs in a background worker. The update is skipped if the movie was
+    deleted or retitled while the lookup was in flight.
+
+    Args:
+        movie_id: ID of the movie to enrich.
+        title: Title the movie was saved with.
+    """
+    try:
+        payload = _enrich_from_omdb(title)
+        if not payload:
+            return
+
+        with app.app_context():
+            dm.update_movie(movie_id, payload, expected_name=title)
+    except Exception:
+        app.logger.exception("OMDb enrichment failed for movie %s", movie_id)
+
+
+def schedule_enrichment(movie_id: int, title: str) -> None:
+    """
+    Queue OMDb enrichment of a movie without blocking the request.
+
+    Args:
+        movie_id: ID of the movie to enrich.
+        title: Title the movie was saved with.
+    """
+    _omdb_executor.submit(_enrich_movie, movie_id, title)
+
+
+@app.url_defaults
+def _static_cache_buster(endpoint, values):
+    """
+    Append the file's mtime to static URLs so long-cached assets refresh on change.
+
+    Args:
+        endpoint: Endpoint the URL is built for.
+        values: URL values, updated in place.
+    """
+    if endpoint != "static" or "filename" not in values:
+        return
+
+    path = os.path.join(app.static_folder, values["filename"])
+    if os.path.isfile(path):
+        values["v"] = int(os.stat(path).st_mtime)
+
+
+def _page_cache_key(*args, **kwargs) -> str:
+    """
+    Build the page-cache key for the current GET request.
+
+    The key is computed before the view reads the database, so a page
+    rendered while a write commits is stored under the old data version
+    and never served afterwards.
+
+    Returns:
+        Cache key made of the data version, path and sorted query string.
+    """
+    query = urlencode(sorted(request.args.items(multi=True)))
+    return f"view/{dm.data_version}{request.path}?{query}"
+
+
+@app.after_request
+def _cache_headers(response):
+    """
+    Make page GETs conditional.
+
+    Pages carry an ETag and must be revalidated, so unchanged pages are
+    answered with 304 Not Modified.
+
+    Args:
+        response: Outgoing response.
+
+    Returns:
+        The (possibly 304) response.
+    """
+    if (
+        request.method == "GET"
+        and response.status_code == 200
+        and response.mimetype == "text/html"
+        and not response.is_streamed
+    ):
+        response.add_etag()
+        response.cache_control.max_age = 0
+        response.cache_control.must_revalidate = True
+        response.make_conditional(request)
+
+    return response
+
+
+# Path of the user_movies route, formatted directly in POST redirects
+USER_MOVIES_PATH = "/users/{user_id}"
+
+
+def _redirect_to_user_movies(user_id: int):
+    """
+    Redirect to a user's movies page without a url_for lookup.
+
+    Args:
+        user_id: ID of the user.
+
+    Returns:
+        Redirect response.
+    """
+    return redirect(request.script_root + USER_MOVIES_PATH.format(user_id=user_id))
+
+
+@cache.memoize()
+def render_sidebar(users_version: str, active_user_id: int) -> Markup:
+    """
+    Render the user sidebar of the movies page.
+
+    Results are memoized in the shared cache; users_version changes in
+    every worker whenever users are added, so a stale list is never served.
+
+    Args:
+        users_version: Current DataManager.users_version.
+        active_user_id: ID of the user to highlight.
+
+    Returns:
+        Rendered sidebar HTML.
+    """
+    users, has_more = dm.get_users_cached()
+    return Markup(
+        render_template(
+            "_sidebar.html",
+            users=users,
+            has_more=has_more,
+            active_user_id=active_user_id,
+        )
     )
-    data = response.json()
 
-    if data.get("Response") != "True":
-        return None
 
-    return data
+def _retitle_movie(movie_id: int, user_id: int):
+    """
+    Rename a movie from the submitted "title" field and queue enrichment.
+
+    Args:
+        movie_id: ID of the movie to update.
+        user_id: ID of the user owning the movie.
+
+    Returns:
+        Redirect to the user's movies page.
+    """
+    new_title = request.form.get("title", "").strip()
+    if new_title and dm.update_movie(movie_id, {"name": new_title}):
+        schedule_enrichment(movie_id, new_title)
+    return _redirect_to_user_movies(user_id)
 
 
 @app.get("/")
+@cache.cached(make_cache_key=_page_cache_key)
 def index():
     """
-    Render the homepage with the list of users.
+    Render the homepage with one page of users.
+
+    The page number is read from the "page" query parameter.
 
     Returns:
         Rendered HTML template.
     """
-    users = dm.get_users()
-    return render_template("index.html", users=users)
+    page = max(request.args.get("page", 1, type=int), 1)
+    if page == 1:
+        users, has_more = dm.get_users_cached()
+    else:
+        users, has_more = dm.get_users_page(page)
+
+    return render_template(
+        "index.html",
+        users=users,
+        page=page,
+        has_more=has_more,
+    )
 
 
 @app.post("/users/<int:user_id>/movies")
@@ -79,8 +606,9 @@ def add_movie(user_id: int):
     """
     Add a movie to a specific user.
 
-    If OMDb is available and the movie is found, add
-    director/year/poster. Otherwise, a minimal movie entry is created.
+    A minimal movie entry is created right away. If OMDb is available
+    and the movie is found, director/year/poster are added in the
+    background.
 
     Args:
         user_id: ID of the user to add the movie to.
@@ -90,25 +618,44 @@ def add_movie(user_id: int):
     """
     title = request.form.get("title", "").strip()
     if not title:
-        return redirect(url_for("user_movies", user_id=user_id))
+        return _redirect_to_user_movies(user_id)
 
-    data = fetch_movie_from_omdb(title)
+    movie = dm.add_movie(Movie(name=title, user_id=user_id))
+    schedule_enrichment(movie.id, title)
+    return _redirect_to_user_movies(user_id)
 
-    # If OMDb fails (missing key or not found), still add the title
-    movie = Movie(
-        name=data.get("Title", title) if data else title,
-        director=(data.get("Director") if data else None),
-        year=(
-            int(data["Year"][:4])
-            if data and data.get("Year") and data["Year"][:4].isdigit()
-            else None
-        ),
-        poster_url=(data.get("Poster") if data else None),
-        user_id=user_id,
-    )
 
-    dm.add_movie(movie)
-    return redirect(url_for("user_movies", user_id=user_id))
+@app.post("/users/<int:user_id>/movies/bulk")
+def bulk_add_movies(user_id: int):
+    """
+    Add several movies to a user from a newline-separated "titles" field.
+
+    Up to MAX_BULK_TITLES titles are looked up in OMDb concurrently and
+    stored in a single transaction; titles not found are added without
+    details and lines beyond the limit are ignored.
+
+    Args:
+        user_id: ID of the user to add the movies to.
+
+    Returns:
+        Redirect to the user's movies page.
+    """
+    titles = [
+        line.strip()
+        for line in request.form.get("titles", "").splitlines()
+        if line.strip()
+    ][:MAX_BULK_TITLES]
+    if not titles:
+        return _redirect_to_user_movies(user_id)
+
+    results = _fetch_many(titles)
+    movies = []
+    for title, data in zip(titles, results):
+        payload = _omdb_payload(data, title) if data else {"name": title}
+        movies.append(Movie(user_id=user_id, **payload))
+
+    dm.bulk_add_movies(movies)
+    return _redirect_to_user_movies(user_id)
 
 
 @app.post("/movies/<int:movie_id>/delete")
@@ -118,7 +665,8 @@ def delete_movie(movie_id: int):
 
     Note:
         This route expects a hidden form field "user_id" to be submitted
-        so the redirect can go back to the correct user page.
+        so the redirect can go back to the correct user page; without it,
+        the redirect goes to the homepage.
 
     Args:
         movie_id: ID of the movie to delete.
@@ -128,7 +676,10 @@ def delete_movie(movie_id: int):
     """
     dm.delete_movie(movie_id)
     user_id = request.form.get("user_id", type=int)
-    return redirect(url_for("user_movies", user_id=user_id))
+    if user_id is None:
+        return redirect(url_for("index"))
+
+    return _redirect_to_user_movies(user_id)
 
 
 @app.post("/users/<int:user_id>/movies/<int:movie_id>/delete")
@@ -144,7 +695,7 @@ def delete_movie_codio(user_id: int, movie_id: int):
         Redirect to the user's movies page.
     """
     dm.delete_movie(movie_id)
-    return redirect(url_for("user_movies", user_id=user_id))
+    return _redirect_to_user_movies(user_id)
 
 
 @app.post("/users")
@@ -162,9 +713,13 @@ def create_user():
 
 
 @app.get("/users/<int:user_id>")
+@cache.cached(make_cache_key=_page_cache_key)
 def user_movies(user_id: int):
     """
-    Render the movies page for a specific user.
+    Render one page of movies for a specific user.
+
+    The page starts after the movie given by the "after_name" and
+    "after_id" query parameters; the sidebar shows the first page of users.
 
     Args:
         user_id: ID of the user whose movies should be displayed.
@@ -172,16 +727,17 @@ def user_movies(user_id: int):
     Returns:
         Rendered HTML template.
     """
-    users = dm.get_users()
-    user = User.query.get(user_id)
-    movies = dm.get_movies(user_id)
+    after_name = request.args.get("after_name")
+    after_id = request.args.get("after_id", type=int)
+    user, movies, has_more = dm.get_user_with_movies(user_id, after_name, after_id)
 
     return render_template(
         "movies.html",
-        users=users,
+        sidebar=render_sidebar(dm.users_version, user_id),
         user=user,
         user_id=user_id,
         movies=movies,
+        has_more=has_more,
     )
 
 
@@ -210,7 +766,7 @@ def update_movie_form(movie_id: int):
     Returns:
         Rendered HTML template or redirect if movie does not exist.
     """
-    movie = Movie.query.get(movie_id)
+    movie = db.session.get(Movie, movie_id)
     if not movie:
         return redirect(url_for("index"))
 
@@ -222,7 +778,7 @@ def update_movie(movie_id: int):
     """
     Update a movie by its ID using a submitted "title" field.
 
-    The title is optionally added via OMDb.
+    OMDb details for the new title are optionally added in the background.
 
     Args:
         movie_id: ID of the movie to update.
@@ -230,38 +786,18 @@ def update_movie(movie_id: int):
     Returns:
         Redirect to the user's movies page.
     """
-    movie = Movie.query.get(movie_id)
+    movie = db.session.get(Movie, movie_id)
     if not movie:
         return redirect(url_for("index"))
 
-    user_id = movie.user_id
-
-    new_title = request.form.get("title", "").strip()
-    if not new_title:
-        return redirect(url_for("user_movies", user_id=user_id))
-
-    data = fetch_movie_from_omdb(new_title)
-
-    payload = {"name": new_title}
-    if data:
-        payload = {
-            "name": data.get("Title", new_title),
-            "director": data.get("Director"),
-            "year": (
-                int(data["Year"][:4])
-                if data.get("Year") and data["Year"][:4].isdigit()
-                else None
-            ),
-            "poster_url": data.get("Poster"),
-        }
-
-    dm.update_movie(movie_id, payload)
-    return redirect(url_for("user_movies", user_id=user_id))
+    return _retitle_movie(movie_id, movie.user_id)
 
 
 @app.post("/users/<int:user_id>/movies/<int:movie_id>/update")
 def update_movie_codio(user_id: int, movie_id: int):
     """
+    Update route that includes user_id in the URL.
+
     Args:
         user_id: ID of the user.
         movie_id: ID of the movie to update.
@@ -269,27 +805,7 @@ def update_movie_codio(user_id: int, movie_id: int):
     Returns:
         Redirect to the user's movies page.
     """
-    new_title = request.form.get("title", "").strip()
-    if not new_title:
-        return redirect(url_for("user_movies", user_id=user_id))
-
-    data = fetch_movie_from_omdb(new_title)
-
-    payload = {"name": new_title}
-    if data:
-        payload = {
-            "name": data.get("Title", new_title),
-            "director": data.get("Director"),
-            "year": (
-                int(data["Year"][:4])
-                if data.get("Year") and data["Year"][:4].isdigit()
-                else None
-            ),
-            "poster_url": data.get("Poster"),
-        }
-
-    dm.update_movie(movie_id, payload)
-    return redirect(url_for("user_movies", user_id=user_id))
+    return _retitle_movie(movie_id, user_id)
 
 
 @app.get("/users")
@@ -297,11 +813,20 @@ def list_users():
     """
     List all users as plain text.
 
+    The response is streamed so memory use does not grow with the
+    number of users.
+
     Returns:
-        HTML string with user IDs and names.
+        Streamed HTML with user IDs and names.
     """
-    users = dm.get_users()
-    return "<br>".join([f"{u.id}: {u.name}" for u in users])
+
+    def generate():
+        separator = ""
+        for u in dm.iter_users():
+            yield f"{separator}{u.id}: {u.name}"
+            separator = "<br>"
+
+    return Response(stream_with_context(generate()), mimetype="text/html")
 
 
 if __name__ == "__main__":
@@ -1,24 +1,161 @@
 """Data access layer for User and Movie database operations."""
 
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
 from models import Movie, User, db
 
+# How long the cached user list stays valid (seconds)
+USERS_CACHE_TTL = 30.0
+
+# Shared-cache keys holding the current version tokens
+USERS_VERSION_KEY = "users_version"
+DATA_VERSION_KEY = "data_version"
+
+# Default page size for user and movie listings
+PER_PAGE = 40
+
+# Movie columns that update_movie is allowed to change
+MOVIE_UPDATE_FIELDS = ("name", "director", "year", "poster_url")
+
+
+class UserRow(NamedTuple):
+    """Lightweight, session-independent snapshot of a user."""
+
+    id: int
+    name: str
+
+
+def _after(after_name: str | None, after_id: int | None):
+    """
+    Build the keyset condition for movies following (after_name, after_id).
+
+    Args:
+        after_name: Name of the last movie already shown, or None.
+        after_id: ID of the last movie already shown, or None.
+
+    Returns:
+        SQL condition; always true if no position is given.
+    """
+    if after_name is None or after_id is None:
+        return db.true()
+
+    return db.tuple_(Movie.name, Movie.id) > db.tuple_(after_name, after_id)
+
 
 class DataManager:
     """Covers database operations for users and movies."""
 
-    def create_user(self, name: str) -> User:
+    def __init__(self, shared_cache: Any = None) -> None:
+        """
+        Args:
+            shared_cache: Optional cache shared by all worker processes
+                (anything with get/add/set, e.g. a Flask-Caching Cache).
+                If given, the version tokens live there so invalidation
+                reaches every worker; otherwise they are per process.
+        """
+        self._shared_cache = shared_cache
+        self._local_versions: dict[str, str] = {}
+        self._users_cache: tuple[list[UserRow], bool] | None = None
+        self._users_cache_version: str | None = None
+        self._users_cache_expires = 0.0
+        self._users_lock = threading.Lock()
+
+    def _get_version(self, key: str) -> str:
+        """
+        Return the version token stored under key, creating one if missing.
+
+        If the shared cache lost the token (expired or evicted), a new one
+        is stored, which makes every worker treat derived data as stale once.
+
+        Args:
+            key: Cache key of the token.
+
+        Returns:
+            The current version token.
+        """
+        if self._shared_cache is None:
+            return self._local_versions.setdefault(key, uuid.uuid4().hex)
+
+        version = self._shared_cache.get(key)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not self._shared_cache.add(key, version, timeout=0):
+                version = self._shared_cache.get(key) or version
+        return version
+
+    def _bump_version(self, key: str) -> None:
+        """
+        Replace the version token stored under key.
+
+        Args:
+            key: Cache key of the token.
+        """
+        version = uuid.uuid4().hex
+        if self._shared_cache is None:
+            self._local_versions[key] = version
+        else:
+            self._shared_cache.set(key, version, timeout=0)
+
+    @property
+    def users_version(self) -> str:
+        """
+        Token that changes whenever users are added.
+
+        Returns:
+            The current users version token.
+        """
+        return self._get_version(USERS_VERSION_KEY)
+
+    @property
+    def data_version(self) -> str:
+        """
+        Token that changes after every committed write.
+
+        Returns:
+            The current data version token.
+        """
+        return self._get_version(DATA_VERSION_KEY)
+
+    def commit(self) -> None:
+        """
+        Commit the current transaction, rolling back on failure.
+
+        Callers that pass commit=False to the write methods use this to
+        persist all pending changes at once. A successful commit replaces
+        data_version.
+        """
+        users_changed = db.session.info.pop("users_changed", False)
+        try:
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        self._bump_version(DATA_VERSION_KEY)
+        if users_changed:
+            self.invalidate_users_cache()
+
+    def create_user(self, name: str, commit: bool = True) -> User:
         """
         Create and persist a new user.
 
         Args:
             name: The users name.
+            commit: Whether to commit immediately.
 
         Returns:
             The newly created User instance.
         """
         new_user = User(name=name)
         db.session.add(new_user)
-        db.session.commit()
+        # Read by commit(); db.session.new misses users already autoflushed
+        db.session.info["users_changed"] = True
+        if commit:
+            self.commit()
         return new_user
 
     def get_users(self) -> list[User]:
@@ -30,78 +167,204 @@ class DataManager:
         """
         return User.query.order_by(User.name.asc()).all()
 
-    def get_movies(self, user_id: int) -> list[Movie]:
+    def iter_users(self, batch_size: int = 500) -> Iterator[User]:
         """
-        Retrieve all movies for a given user, ascending movie name.
+        Iterate over all users ordered by name, fetching rows in batches.
 
         Args:
-            user_id: Owning user's ID.
+            batch_size: Number of rows fetched from the database at a time.
 
         Returns:
-            A list of Movie objects for the user.
+            An iterator of User objects.
+        """
+        return db.session.scalars(
+            db.select(User)
+            .order_by(User.name.asc())
+            .execution_options(yield_per=batch_size)
+        )
+
+    def get_users_page(
+        self, page: int = 1, per_page: int = PER_PAGE
+    ) -> tuple[list[User], bool]:
         """
-        return (
-            Movie.query.filter_by(user_id=user_id)
-            .order_by(Movie.name.asc())
+        Retrieve one page of users ordered by name (ascending).
+
+        Args:
+            page: 1-based page number.
+            per_page: Number of users per page.
+
+        Returns:
+            Tuple of the users on the page and whether more pages follow.
+        """
+        rows = (
+            User.query.order_by(User.name.asc())
+            .limit(per_page + 1)
+            .offset((page - 1) * per_page)
             .all()
         )
+        return rows[:per_page], len(rows) > per_page
+
+    def get_users_cached(self) -> tuple[list[UserRow], bool]:
+        """
+        Retrieve the first page of users, served from a short-lived cache.
+
+        The cache is refreshed when users_version changes, including
+        changes made by other worker processes.
+
+        Returns:
+            Tuple of UserRow snapshots and whether more users exist.
+        """
+        version = self.users_version
+        with self._users_lock:
+            now = time.monotonic()
+            if (
+                self._users_cache is None
+                or version != self._users_cache_version
+                or now >= self._users_cache_expires
+            ):
+                users, has_more = self.get_users_page()
+                self._users_cache = ([UserRow(u.id, u.name) for u in users], has_more)
+                self._users_cache_version = version
+                self._users_cache_expires = now + USERS_CACHE_TTL
+            return self._users_cache
 
-    def add_movie(self, movie: Movie) -> Movie:
+    def invalidate_users_cache(self) -> None:
+        """
+        Drop the cached user list so the next read hits the database.
+
+        Also replaces users_version, which keys caches derived from the list.
+        """
+        self._bump_version(USERS_VERSION_KEY)
+        with self._users_lock:
+            self._users_cache = None
+
+    def get_user_with_movies(
+        self,
+        user_id: int,
+        after_name: str | None = None,
+        after_id: int | None = None,
+        per_page: int = PER_PAGE,
+    ) -> tuple[User | None, list[Movie], bool]:
+        """
+        Retrieve a user and one page of their movies in one query.
+
+        Movies are ordered by name, then id, and paged by keyset: each page
+        is an index range scan that does not depend on how deep the user
+        has paged.
+
+        Args:
+            user_id: The user's ID.
+            after_name: Name of the last movie already shown, or None to start.
+            after_id: ID of the last movie already shown, or None to start.
+            per_page: Number of movies per page.
+
+        Returns:
+            Tuple of the User (or None if not found), the movies on the
+            page and whether more movies follow.
+        """
+        # The keyset filter lives in the join condition, so the user row is
+        # returned even when no movies are left.
+        rows = db.session.execute(
+            db.select(User, Movie)
+            .outerjoin(
+                Movie,
+                db.and_(Movie.user_id == User.id, _after(after_name, after_id)),
+            )
+            .where(User.id == user_id)
+            .order_by(Movie.name.asc(), Movie.id.asc())
+            .limit(per_page + 1)
+        ).all()
+
+        if not rows:
+            return None, [], False
+
+        user = rows[0][0]
+        movies = [movie for _, movie in rows[:per_page] if movie is not None]
+        return user, movies, len(rows) > per_page
+
+    def add_movie(self, movie: Movie, commit: bool = True) -> Movie:
         """
         Persist a Movie object.
 
         Args:
             movie: The Movie instance to store.
+            commit: Whether to commit immediately.
 
         Returns:
             The stored Movie instance.
         """
         db.session.add(movie)
-        db.session.commit()
+        if commit:
+            self.commit()
         return movie
 
-    def update_movie(self, movie_id: int, updated_fields: dict) -> Movie | None:
+    def bulk_add_movies(self, movies: Iterable[Movie]) -> list[Movie]:
         """
-        Update specific fields of a movie.
+        Persist many Movie objects in a single transaction.
+
+        Args:
+            movies: The Movie instances to store.
+
+        Returns:
+            The stored Movie instances.
+        """
+        movies = list(movies)
+        db.session.add_all(movies)
+        self.commit()
+        return movies
+
+    def update_movie(
+        self,
+        movie_id: int,
+        updated_fields: dict,
+        commit: bool = True,
+        expected_name: str | None = None,
+    ) -> bool:
+        """
+        Update specific fields of a movie with a single UPDATE statement.
 
         Args:
             movie_id: ID of the movie to update.
             updated_fields: Dict of fields to update (e.g. name, director, year, poster_url).
+            commit: Whether to commit immediately.
+            expected_name: If given, only update the movie while its name
+                still equals this value (checked in the same statement).
 
         Returns:
-            The updated Movie if found, otherwise None.
-        """
-        movie = Movie.query.get(movie_id)
-        if not movie:
-            return None
-
-        if "name" in updated_fields:
-            movie.name = updated_fields["name"]
-        if "director" in updated_fields:
-            movie.director = updated_fields["director"]
-        if "year" in updated_fields:
-            movie.year = updated_fields["year"]
-        if "poster_url" in updated_fields:
-            movie.poster_url = updated_fields["poster_url"]
-
-        db.session.commit()
-        return movie
+            True if a matching movie was found, otherwise False.
+        """
+        conditions = [Movie.id == movie_id]
+        if expected_name is not None:
+            conditions.append(Movie.name == expected_name)
+
+        values = {
+            key: updated_fields[key]
+            for key in MOVIE_UPDATE_FIELDS
+            if key in updated_fields
+        }
+        if not values:
+            return db.session.scalar(db.select(Movie.id).where(*conditions)) is not None
 
-    def delete_movie(self, movie_id: int) -> bool:
+        result = db.session.execute(
+            db.update(Movie).where(*conditions).values(**values)
+        )
+        if commit:
+            self.commit()
+        return result.rowcount > 0
+
+    def delete_movie(self, movie_id: int, commit: bool = True) -> bool:
         """
-        Delete a movie by its ID.
+        Delete a movie by its ID with a single DELETE statement.
 
         Args:
             movie_id: ID of the movie.
+            commit: Whether to commit immediately.
 
         Returns:
             True if deleted; False if not found.
         """
-        movie = Movie.query.get(movie_id)
-        if not movie:
-            return False
-
-        db.session.delete(movie)
-        db.session.commit()
-        return True
+        result = db.session.execute(db.delete(Movie).where(Movie.id == movie_id))
+        if commit:
+            self.commit()
+        return result.rowcount > 0
         
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""
+Gunicorn settings for serving the app.
+
+By default each worker uses gevent, so requests waiting on OMDb yield to
+others instead of holding an OS thread. gevent does not patch sqlite3, so
+database calls are serialized per worker and block it while they run. For
+DB-heavy load, or where monkey-patching is unsafe, set
+GUNICORN_WORKER_CLASS=gthread to use threaded workers.
+
+Usage:
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "4"))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gevent")
+
+# Concurrent connections per gevent worker
+worker_connections = 1000
+
+# Threads per worker (only used by the gthread worker class)
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
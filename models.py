@@ -9,18 +9,22 @@ class User(db.Model):
     """Represents an application user who can have multiple movies."""
 
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
 
     movies = db.relationship(
         "Movie",
         backref="user",
         cascade="all, delete-orphan",
+        order_by="Movie.name",
     )
 
 
 class Movie(db.Model):
     """Represents a movie entry owned by a user."""
 
+    # Serves the user_id filter and (name, id) keyset in get_user_with_movies
+    __table_args__ = (db.Index("ix_movie_user_name", "user_id", "name"),)
+
     id = db.Column(db.Integer, primary_key=True)
 
     name = db.Column(db.String(200), nullable=False)
@@ -0,0 +1,29 @@
+// Append the next page of a list in place instead of navigating to it.
+document.addEventListener("click", async (event) => {
+  const link = event.target.closest("a.load-more");
+  if (!link) {
+    return;
+  }
+  event.preventDefault();
+
+  const response = await fetch(link.href);
+  if (!response.ok) {
+    window.location.href = link.href;
+    return;
+  }
+
+  const selector = link.dataset.target;
+  const page = new DOMParser().parseFromString(await response.text(), "text/html");
+  const target = document.querySelector(selector);
+  const incoming = page.querySelector(selector);
+  if (target && incoming) {
+    target.append(...incoming.children);
+  }
+
+  const next = page.querySelector(`a.load-more[data-target="${selector}"]`);
+  if (next) {
+    link.replaceWith(next);
+  } else {
+    link.remove();
+  }
+});
@@ -0,0 +1,96 @@
+"""Tests for the bulk movie import route."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside a gevent-patched interpreter: three bulk imports are posted
+# concurrently from greenlets of the same process, as in one gevent worker.
+CONCURRENT_IMPORTS_SCRIPT = """
+import time
+
+import gevent
+import httpx
+
+import app as A
+
+
+def handler(request):
+    time.sleep(0.05)  # cooperative under gevent, so the imports interleave
+    title = request.url.params["t"]
+    return httpx.Response(200, json={"Response": "True", "Title": title.upper()})
+
+
+real_client = httpx.Client
+A.httpx.Client = lambda **kwargs: real_client(
+    transport=httpx.MockTransport(handler), **kwargs
+)
+
+client = A.app.test_client()
+client.post("/users", data={"name": "Ann"})
+
+
+def post(i):
+    titles = "\\n".join(f"title {i}-{n}" for n in range(5))
+    response = client.post("/users/1/movies/bulk", data={"titles": titles})
+    return response.status_code
+
+
+jobs = [gevent.spawn(post, i) for i in range(3)]
+gevent.joinall(jobs)
+print(*(job.value for job in jobs))
+
+with A.app.app_context():
+    print(A.Movie.query.filter(A.Movie.name.like("TITLE %")).count())
+"""
+
+
+def _has_gevent() -> bool:
+    try:
+        import gevent  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@unittest.skipUnless(_has_gevent(), "gevent is not installed")
+class ConcurrentBulkImportTest(unittest.TestCase):
+    """Bulk imports running concurrently in one gevent worker."""
+
+    def setUp(self):
+        # Work on a copy so the app's SQLite and cache files stay out of the repo
+        self.app_dir = Path(tempfile.mkdtemp())
+        for name in ("app.py", "data_manager.py", "models.py"):
+            shutil.copy(REPO_DIR / name, self.app_dir)
+        for name in ("templates", "static"):
+            shutil.copytree(REPO_DIR / name, self.app_dir / name)
+        (self.app_dir / "data").mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.app_dir, ignore_errors=True)
+
+    def test_concurrent_imports_in_one_worker(self):
+        env = dict(os.environ, GEVENT_PATCH="1", OMDB_API_KEY="test")
+        result = subprocess.run(
+            [sys.executable, "-c", CONCURRENT_IMPORTS_SCRIPT],
+            cwd=self.app_dir,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        statuses, movie_count = result.stdout.split("\n")[:2]
+        self.assertEqual(statuses, "302 302 302")
+        self.assertEqual(movie_count, "15")
+
+
+if __name__ == "__main__":
+    unittest.main()